@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import os
 from python.helpers.api import ApiHandler, Request, Response
@@ -5,6 +6,52 @@ from python.helpers import files
 from python.helpers.print_style import PrintStyle
 import json
 
+# read size for base64 encoding, must be a multiple of 3 so chunks concatenate cleanly
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+
+# internal upload paths map onto this directory, resolved once at import
+_UPLOADS_PREFIX = "/a0/tmp/uploads/"
+_UPLOADS_DIR = files.get_abs_path("tmp/uploads")
+
+# fixed error bodies, encoded once instead of per request
+_ERR_PATHS_REQUIRED = b'{"error": "paths array is required"}'
+_ERR_PATHS_NOT_ARRAY = b'{"error": "paths must be an array"}'
+
+
+def _read_base64(path: str) -> tuple[str, int]:
+    """Read a file and return its base64 content and raw size without holding the raw bytes in memory."""
+    # open() already fstats the fd and raises on missing files and directories
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        buf = bytearray(4 * ((size + 2) // 3))
+        pos = 0
+        read = 0
+        while chunk := f.read(_B64_CHUNK_SIZE):
+            encoded = base64.b64encode(chunk)
+            buf[pos:pos + len(encoded)] = encoded
+            pos += len(encoded)
+            read += len(chunk)
+        del buf[pos:]
+    return buf.decode("ascii"), read
+
+
+def _resolve(path) -> tuple[str, str] | None:
+    """Map a requested path to (external_path, filename), or None if it is not a usable path."""
+    if not isinstance(path, str):
+        return None
+    # Convert internal paths to external paths
+    if path.startswith(_UPLOADS_PREFIX):
+        # Internal path - convert to external
+        external_path = os.path.join(_UPLOADS_DIR, path.removeprefix(_UPLOADS_PREFIX))
+    elif path.startswith("/a0/"):
+        # Other internal Agent Zero paths
+        relative_path = path.removeprefix("/a0/")
+        external_path = files.get_abs_path(relative_path)
+    else:
+        # Assume it's already an external/absolute path
+        external_path = path
+    return external_path, os.path.basename(external_path)
+
 
 class ApiFilesGet(ApiHandler):
     @classmethod
@@ -30,54 +77,47 @@ class ApiFilesGet(ApiHandler):
 
             if not paths:
                 return Response(
-                    '{"error": "paths array is required"}',
+                    _ERR_PATHS_REQUIRED,
                     status=400,
                     mimetype="application/json"
                 )
 
             if not isinstance(paths, list):
                 return Response(
-                    '{"error": "paths must be an array"}',
+                    _ERR_PATHS_NOT_ARRAY,
                     status=400,
                     mimetype="application/json"
                 )
 
             result = {}
+            pending: list[tuple[str, str, str]] = []
 
             for path in paths:
-                try:
-                    # Convert internal paths to external paths
-                    if path.startswith("/a0/tmp/uploads/"):
-                        # Internal path - convert to external
-                        filename = path.replace("/a0/tmp/uploads/", "")
-                        external_path = files.get_abs_path("tmp/uploads", filename)
-                        filename = os.path.basename(external_path)
-                    elif path.startswith("/a0/"):
-                        # Other internal Agent Zero paths
-                        relative_path = path.replace("/a0/", "")
-                        external_path = files.get_abs_path(relative_path)
-                        filename = os.path.basename(external_path)
-                    else:
-                        # Assume it's already an external/absolute path
-                        external_path = path
-                        filename = os.path.basename(path)
-
-                    # Check if file exists
-                    if not os.path.exists(external_path):
-                        PrintStyle.warning(f"File not found: {path}")
-                        continue
-
-                    # Read and encode file
-                    with open(external_path, "rb") as f:
-                        file_content = f.read()
-                        base64_content = base64.b64encode(file_content).decode('utf-8')
-                        result[filename] = base64_content
-
-                    PrintStyle().print(f"Retrieved file: {filename} ({len(file_content)} bytes)")
-
-                except Exception as e:
-                    PrintStyle.error(f"Failed to read file {path}: {str(e)}")
+                resolved = _resolve(path)
+                if resolved is None:
+                    PrintStyle.error(f"Failed to read file {path}: invalid path")
                     continue
+                external_path, filename = resolved
+                pending.append((path, filename, external_path))
+
+            # Read and encode all files concurrently in worker threads
+            reads = await asyncio.gather(
+                *(asyncio.to_thread(_read_base64, external_path) for _, _, external_path in pending),
+                return_exceptions=True,
+            )
+
+            for (path, filename, _), read in zip(pending, reads):
+                # a missing file is only a warning
+                if isinstance(read, FileNotFoundError):
+                    PrintStyle.warning(f"File not found: {path}")
+                    continue
+                if isinstance(read, BaseException):
+                    PrintStyle.error(f"Failed to read file {path}: {str(read)}")
+                    continue
+
+                base64_content, size = read
+                result[filename] = base64_content
+                PrintStyle().print(f"Retrieved file: {filename} ({size} bytes)")
 
             # Log the retrieval
             PrintStyle(
@@ -1,4 +1,5 @@
 import os
+import stat
 from python.helpers.api import ApiHandler, Input, Output, Request, Response
 from python.helpers import files, runtime
 from typing import TypedDict
@@ -27,9 +28,17 @@ class FileInfo(TypedDict):
 
 async def get_file_info(path: str) -> FileInfo:
     abs_path = files.get_abs_path(path)
-    exists = os.path.exists(abs_path)
     message = ""
 
+    # one lstat for the link check, one stat for the target (only when the path is a symlink)
+    try:
+        lst = os.lstat(abs_path)
+        st = os.stat(abs_path) if stat.S_ISLNK(lst.st_mode) else lst
+    except (OSError, ValueError):
+        # like os.path.exists, treat unrepresentable paths (e.g. an embedded NUL byte) as missing
+        lst = st = None
+
+    exists = st is not None
     if not exists:
         message = f"File {path} not found."
 
@@ -37,13 +46,13 @@ async def get_file_info(path: str) -> FileInfo:
         "input_path": path,
         "abs_path": abs_path,
         "exists": exists,
-        "is_dir": os.path.isdir(abs_path) if exists else False,
-        "is_file": os.path.isfile(abs_path) if exists else False,
-        "is_link": os.path.islink(abs_path) if exists else False,
-        "size": os.path.getsize(abs_path) if exists else 0,
-        "modified": os.path.getmtime(abs_path) if exists else 0,
-        "created": os.path.getctime(abs_path) if exists else 0,
-        "permissions": os.stat(abs_path).st_mode if exists else 0,
+        "is_dir": stat.S_ISDIR(st.st_mode) if st else False,
+        "is_file": stat.S_ISREG(st.st_mode) if st else False,
+        "is_link": stat.S_ISLNK(lst.st_mode) if st and lst else False,
+        "size": st.st_size if st else 0,
+        "modified": st.st_mtime if st else 0,
+        "created": st.st_ctime if st else 0,
+        "permissions": st.st_mode if st else 0,
         "dir_path": os.path.dirname(abs_path),
         "file_name": os.path.basename(abs_path),
         "file_ext": os.path.splitext(abs_path)[1],
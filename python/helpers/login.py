@@ -1,4 +1,5 @@
 from python.helpers import dotenv
+import functools
 import hashlib
 
 
@@ -7,6 +8,12 @@ def get_credentials_hash():
     password = dotenv.get_dotenv_value("AUTH_PASSWORD")
     if not user:
         return None
+    return _hash_credentials(user, password)
+
+
+# keyed by the values themselves, so credentials changed in settings are picked up without invalidation
+@functools.lru_cache(maxsize=4)
+def _hash_credentials(user: str, password: str | None) -> str:
     return hashlib.sha256(f"{user}:{password}".encode()).hexdigest()
 
 